@@ -101,7 +101,7 @@ class AttentionMask(DataclassAsDict):
             )
         return AttentionMask(bool_mask=bool_mask)
 
-    def apply_logit_mask(self, input: Tensor) -> Tensor:
+    def apply_logit_mask(self, input: Tensor, *, inplace: bool = False) -> Tensor:
         """
         Use the attention mask to mask attention logits.
 
@@ -109,12 +109,16 @@ class AttentionMask(DataclassAsDict):
             Attention logits to apply the mask to.
 
             *Shape:* ``(batch_size, heads, query_len, key_len)``
+        :param inplace:
+            Mask the attention logits inplace.
         :returns:
             Logits with the attention mask applied.
 
             *Shape:* ``(batch_size, heads, query_len, key_len)``
         """
         blocked_value = torch.finfo(input.dtype).min
+        if inplace:
+            return input.masked_fill_(self.bool_mask.logical_not(), blocked_value)
         return torch.where(self.bool_mask, input, blocked_value)
 
     def filter_batch_items(self, mask: Tensor) -> "AttentionMask":
@@ -177,7 +181,11 @@ class AttentionMask(DataclassAsDict):
         :returns:
             Logit mask.
         """
-        return (1.0 - self.bool_mask.to(dtype)) * torch.finfo(dtype).min
+        # Select between the two values directly, rather than converting
+        # the boolean mask to ``dtype`` and then scaling it. This creates
+        # the logit mask with a single kernel.
+        zero = torch.zeros((), dtype=dtype, device=self.device)
+        return torch.where(self.bool_mask, zero, torch.finfo(dtype).min)
 
     def extend_length(self, count: int, fill_value: bool) -> "AttentionMask":
         """
@@ -239,10 +247,13 @@ def create_causal_mask(query: Tensor, key: Tensor) -> AttentionMask:
     query_len = query.size(2)
     key_len = key.size(2)
 
+    # Queries are the last query_len positions of the key sequence. Only
+    # construct the rows of the mask for these positions.
     causal_mask = torch.tril(
-        torch.ones((key_len, key_len), device=query.device, dtype=torch.bool),
-    ).view(1, 1, key_len, key_len)
-    return AttentionMask(causal_mask[:, :, key_len - query_len : key_len, :key_len])
+        torch.ones((query_len, key_len), device=query.device, dtype=torch.bool),
+        diagonal=key_len - query_len,
+    ).view(1, 1, query_len, key_len)
+    return AttentionMask(causal_mask)
 
 
 class QkvSplit(ABC):
@@ -701,7 +712,9 @@ class ScaledDotProductAttention(Module):
         if self.linear_biases is not None:
             attn_scores = self.linear_biases(attention_scores=attn_scores)
 
-        attn_scores = attention_mask.apply_logit_mask(attn_scores)
+        # The attention scores are a temporary, so we can mask them in-place
+        # rather than allocating another scores tensor.
+        attn_scores = attention_mask.apply_logit_mask(attn_scores, inplace=True)
         attn_weights = attn_scores.softmax(dim=-1)
         attn_values = self.dropout(attn_weights @ value)
 
@@ -871,7 +884,10 @@ class SelfAttention(Module):
             value = torch.cat([cache_v, value], dim=-2)
 
         combined_mask = attention_mask
-        if use_causal_mask:
+        # A single query (e.g. when decoding with a cache) can attend to all
+        # keys, so the causal mask would not mask anything. When tracing, we
+        # cannot specialize on the query length.
+        if use_causal_mask and (torch.jit.is_tracing() or query.size(2) > 1):
             causal_mask = create_causal_mask(query, key)
             combined_mask = combined_mask.merge_mask(causal_mask)
 
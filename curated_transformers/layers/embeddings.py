@@ -157,7 +157,13 @@ class RotaryEmbeddings(Module):
         input_2 = input[..., :half_idx]
         return torch.cat([input_1, input_2], dim=-1)
 
-    def forward(self, input: torch.Tensor, *, positions: Optional[Tensor] = None):
+    def forward(
+        self,
+        input: torch.Tensor,
+        *,
+        positions: Optional[Tensor] = None,
+        offset: int = 0,
+    ):
         """
         Apply rotary embeddings to the input.
 
@@ -167,9 +173,12 @@ class RotaryEmbeddings(Module):
             *Shape:* ``(batch_size, n_heads, seq_len, width_per_head)``
         :param positions:
             Positions of the inputs. If no positions are
-            provided, they are assumed to be ``[0, seq_len)``.
+            provided, they are assumed to be ``[offset, offset + seq_len)``.
 
             *Shape:* ``(batch_size, seq_len)``
+        :param offset:
+            Position of the first input when no positions are provided.
+            Cannot be used in conjunction with ``positions``.
         :returns:
             Input with the rotary embeddings applied.
 
@@ -178,11 +187,16 @@ class RotaryEmbeddings(Module):
         batch_size, _, seq_len, width = input.shape
 
         if positions is None:
-            # Fastpath: positions from [0..seq_len), avoid indexing.
-            if self.cos.size(-2) < seq_len:
-                self._create_rotary_embed(width=width, length=seq_len)
-            rot_cos = self.cos[:seq_len, :].view(1, 1, seq_len, width)
-            rot_sin = self.sin[:seq_len, :].view(1, 1, seq_len, width)
+            # Fastpath: positions from [offset..offset+seq_len), avoid indexing.
+            end = offset + seq_len
+            if self.cos.size(-2) < end:
+                self._create_rotary_embed(width=width, length=end)
+            rot_cos = self.cos[offset:end, :].view(1, 1, seq_len, width)
+            rot_sin = self.sin[offset:end, :].view(1, 1, seq_len, width)
+        elif offset != 0:
+            raise ValueError(
+                "Rotary embeddings cannot be applied with both positions and an offset"
+            )
         else:
             max_len = int(positions.max()) + 1
             if self.cos.size(-2) < max_len:
@@ -283,21 +297,16 @@ class QueryKeyRotaryEmbeddings(Module):
         cache = KeyValueCache.jit_rewrap(cache)
 
         # If a cache was provided, but no positions, assume that the
-        # positions of the current batch continue from the cache.
+        # positions of the current batch continue from the cache. The
+        # embeddings can then be sliced, rather than gathered by position.
+        offset = 0
         if cache is not None and positions is None:
-            cache_len = cache.key.size(-2)
-            seq_len = key.size(-2)
-            positions = torch.arange(
-                cache_len,
-                cache_len + seq_len,
-                dtype=torch.long,  # `torch.int32` isn't supported in indexing operations prior in torch<2.0.0.
-                device=key.device,
-            ).repeat(key.size(0), 1)
+            offset = cache.key.size(-2)
 
         if rotary_width == head_width:
             # Fast path: we apply rotary embeddings the full key/query vectors.
-            key = self.rotary_embeds(key, positions=positions)
-            query = self.rotary_embeds(query, positions=positions)
+            key = self.rotary_embeds(key, positions=positions, offset=offset)
+            query = self.rotary_embeds(query, positions=positions, offset=offset)
         else:
             # Otherwise, split up key/query vectors, apply rotary embeddings
             # and concatenate again.
@@ -307,8 +316,8 @@ class QueryKeyRotaryEmbeddings(Module):
             )
 
             # Apply rotary embeddings.
-            k_rotary = self.rotary_embeds(k_rotary, positions=positions)
-            q_rotary = self.rotary_embeds(q_rotary, positions=positions)
+            k_rotary = self.rotary_embeds(k_rotary, positions=positions, offset=offset)
+            q_rotary = self.rotary_embeds(q_rotary, positions=positions, offset=offset)
 
             query = torch.cat([q_rotary, q_rest], dim=-1)
             key = torch.cat([k_rotary, k_rest], dim=-1)
@@ -30,6 +30,8 @@ class PointwiseFeedForward(Module):
         (g(xW_g + b_g) * (xW_1 + b_1))W_2 + b_2
 
     :math:`W_g` and :math:`b_g` are the affine transformation for the gate.
+    The gate and intermediate projections can optionally be computed using a
+    single merged projection.
 
     .. _Vaswani et al., 2017: https://arxiv.org/abs/1706.03762
     .. _Dauphin et al., 2016: https://arxiv.org/abs/1612.08083
@@ -46,6 +48,7 @@ class PointwiseFeedForward(Module):
         intermediate_width: int,
         use_bias: bool,
         use_gate: bool,
+        use_fused_gate: bool = False,
         device: Optional[torch.device] = None,
     ):
         """
@@ -63,15 +66,27 @@ class PointwiseFeedForward(Module):
             Use biases for linear layers.
         :param use_gate:
             Use Gated Linear Units.
+        :param use_fused_gate:
+            Use a single projection for the gate and the intermediate
+            representations. The weights of the gate are stored before
+            the weights of the intermediate projection. Requires
+            ``use_gate``.
         :param device:
             Device on which the module is to be initialized.
         """
         super().__init__()
 
+        if use_fused_gate and not use_gate:
+            raise ValueError("A fused gate can only be used with Gated Linear Units")
+
+        self.use_fused_gate = use_fused_gate
         self.intermediate = Linear(
-            hidden_width, intermediate_width, bias=use_bias, device=device
+            hidden_width,
+            2 * intermediate_width if use_fused_gate else intermediate_width,
+            bias=use_bias,
+            device=device,
         )
-        if use_gate:
+        if use_gate and not use_fused_gate:
             self.gate = Linear(
                 hidden_width, intermediate_width, bias=use_bias, device=device
             )
@@ -95,9 +110,24 @@ class PointwiseFeedForward(Module):
 
             *Shape:* ``(batch_size, seq_len, width)``
         """
-        if self.gate is None:
+        if self.gate is None and not self.use_fused_gate:
             return self.output(self.activation(self.intermediate(input)))
+
+        if self.use_fused_gate:
+            gate, intermediate = self.intermediate(input).chunk(2, dim=-1)
         else:
-            return self.output(
-                self.activation(self.gate(input)) * self.intermediate(input)
-            )
+            assert self.gate is not None
+            gate = self.gate(input)
+            intermediate = self.intermediate(input)
+
+        gate = self.activation(gate)
+        if torch.is_grad_enabled() or torch.jit.is_tracing():
+            # The traced graph must not depend on the grad mode, since tracing
+            # re-runs the model with gradients disabled to check the graph.
+            gated = gate * intermediate
+        else:
+            # The activated gate is a temporary that does not overlap with the
+            # intermediate representation, so we can multiply in-place to
+            # avoid allocating another intermediate-sized tensor.
+            gated = gate.mul_(intermediate)
+        return self.output(gated)
@@ -1,9 +1,13 @@
 from typing import Optional
 
 import torch
+import torch.nn.functional as F
 from torch import Tensor
 from torch.nn import Module, Parameter
 
+# Provided as of PyTorch 2.4.
+_has_rms_norm = hasattr(F, "rms_norm")
+
 
 class RMSNorm(Module):
     """
@@ -42,12 +46,22 @@ class RMSNorm(Module):
         # Zhang & Sennrich, Equation 4. If we are in lower precision than
         # float32, then squaring and averaging can get way off. So for
         # normalization we want to use higher precision.
-        rms = (
-            input.to(torch.float32)
-            .square()
-            .mean(-1, keepdim=True)
-            .add(self.eps)
-            .rsqrt()
-        )
-
-        return (input * rms).to(input.dtype) * self.weight
+        width = input.size(-1)
+        if _has_rms_norm:
+            # The weight is applied after converting back to the input
+            # dtype, so we cannot pass it to the PyTorch implementation.
+            output = F.rms_norm(input.to(torch.float32), (width,), eps=self.eps)
+        else:
+            # The mean of squares is computed from the L2 norm, which is a
+            # single reduction over the input. This avoids writing and reading
+            # back a squared copy of the (potentially large) input.
+            rms = (
+                torch.linalg.vector_norm(input.to(torch.float32), dim=-1, keepdim=True)
+                .square()
+                .div(width)
+                .add(self.eps)
+                .rsqrt()
+            )
+            output = input * rms
+
+        return output.to(input.dtype) * self.weight
@@ -3,6 +3,7 @@ from typing import Any, Mapping, Optional, Type, TypeVar
 import torch
 from torch import Tensor
 from torch.nn import Dropout, LayerNorm
+from torch.utils.checkpoint import checkpoint
 
 from ...layers.attention import AttentionMask
 from ...layers.transformer import (
@@ -69,6 +70,9 @@ class ALBERTEncoder(EncoderModule, FromHFHub):
             device=device,
         )
 
+        # Number of consecutive hidden layers that a group is used for.
+        self.layers_per_group = self.n_hidden_layers // n_hidden_groups
+
         # Parameters are shared by groups of layers.
         self.groups = torch.nn.ModuleList(
             [
@@ -77,6 +81,21 @@ class ALBERTEncoder(EncoderModule, FromHFHub):
             ]
         )
 
+        self.gradient_checkpointing = False
+
+    def enable_gradient_checkpointing(self, enable: bool = True):
+        """
+        Enable gradient checkpointing of the layer groups during training.
+
+        When enabled, the activations inside a layer group are not stored,
+        but recomputed during the backward pass. This reduces memory use
+        during training at the cost of additional computation.
+
+        :param enable:
+            Whether to use gradient checkpointing.
+        """
+        self.gradient_checkpointing = enable
+
     def forward(
         self,
         piece_ids: Tensor,
@@ -84,17 +103,58 @@ class ALBERTEncoder(EncoderModule, FromHFHub):
         *,
         type_ids: Optional[Tensor] = None,
         positions: Optional[Tensor] = None,
+        output_hidden_states: bool = True,
     ) -> ModelOutput:
+        """
+        Apply the encoder to the input.
+
+        :param piece_ids:
+            Piece identifiers to apply the encoder to.
+
+            *Shape:* ``(batch_size, seq_len)``
+        :param attention_mask:
+            Attention mask. Sequence elements for which the
+            corresponding mask element is set to ``False`` are ignored
+            during attention calculation.
+        :param type_ids:
+            Type identifiers to indicate the spans of different
+            sequences in the input. Useful when performing tasks like
+            sequence classification and question answering.
+
+            *Shape:* ``(batch_size, seq_len)``
+        :param positions:
+            Input positions. Positions are used to look up position embeddings.
+            Normally, these positions are calculated automatically. But if the
+            positions deviate for some reason, they can be provided through this argument.
+
+            *Shape:* ``(batch_size, seq_len)``
+        :param output_hidden_states:
+            Return the hidden representations of all layers. When set to
+            ``False``, only the representations of the last layer are
+            returned. The intermediate representations can then be freed
+            as soon as the next layer is applied.
+        :returns:
+            Encoder output.
+        """
         embeddings = self.embeddings(piece_ids, positions=positions, type_ids=type_ids)
         layer_output = embeddings
 
-        layers_per_group = self.n_hidden_layers // len(self.groups)
+        use_checkpointing = self.gradient_checkpointing and self.training
 
         layer_outputs = []
         for group in self.groups:
-            for _ in range(layers_per_group):
-                layer_output, _ = group(layer_output, attention_mask=attention_mask)
-                layer_outputs.append(layer_output)
+            for _ in range(self.layers_per_group):
+                if use_checkpointing:
+                    layer_output = checkpoint(
+                        group, layer_output, attention_mask, use_reentrant=False
+                    )
+                else:
+                    layer_output = group(layer_output, attention_mask=attention_mask)
+                if output_hidden_states:
+                    layer_outputs.append(layer_output)
+
+        if not output_hidden_states:
+            layer_outputs.append(layer_output)
 
         return ModelOutput(all_outputs=[embeddings, *layer_outputs])
 
@@ -88,5 +88,5 @@ class ALBERTLayerGroup(Module):
         """
         layer_output = input
         for layer in self.group_layers:
-            layer_output = layer(layer_output, attention_mask)
+            layer_output, _ = layer(layer_output, attention_mask)
         return layer_output
@@ -50,6 +50,22 @@ class FromHFHub(ABC):
         """
         raise NotImplementedError
 
+    @classmethod
+    def is_incomplete_hf_state_dict_key(cls, key: str) -> bool:
+        """
+        Check if a key returned by ``convert_hf_state_dict`` belongs to
+        an incomplete part of a parameter. This is the case when a parameter
+        is stored as multiple tensors in Hugging Face checkpoints which are
+        not in the same checkpoint shard. Incomplete parts are passed to
+        ``convert_hf_state_dict`` again with the next checkpoint shard.
+
+        :param key:
+            Key of the converted state dict.
+        :returns:
+            Whether the key belongs to an incomplete parameter part.
+        """
+        return False
+
     @classmethod
     @abstractmethod
     def from_hf_config(
@@ -123,6 +139,7 @@ class FromHFHub(ABC):
             state_dict_converter=cls.convert_hf_state_dict,
             tensor_to_param_converter=tensor2param,
             device=device,
+            is_incomplete_key=cls.is_incomplete_hf_state_dict_key,
         )
 
         # Ensure that any non-persistent buffers are also moved to
@@ -1,6 +1,8 @@
 import re
-from typing import Any, Callable, Dict, Mapping, Tuple, Union
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Mapping, Tuple, Union
 
+import torch
 from torch import Tensor
 
 from ...layers.activations import Activation
@@ -13,6 +15,18 @@ HIDDEN_DROPOUT = "hidden_dropout_prob"
 EXTRA_KWARG_KEYS = [ATTENTION_DROPOUT, HIDDEN_DROPOUT]
 
 
+# Hugging Face parameters that are merged into a single parameter.
+MERGED_PARAMETERS: List[Tuple[List[str], str]] = [
+    (["q_proj", "k_proj", "v_proj"], "input"),
+    (["gate_proj", "up_proj"], "intermediate"),
+]
+
+INCOMPLETE_KEY_PATTERN = re.compile(
+    rf"\.({'|'.join(part for parts, _ in MERGED_PARAMETERS for part in parts)})"
+    r"\.(weight|bias)$"
+)
+
+
 HF_CONFIG_KEY_MAPPING: Dict[str, Union[str, Tuple[str, Callable]]] = {
     "hidden_act": ("activation", Activation),
     "hidden_size": "hidden_width",
@@ -44,7 +58,12 @@ def convert_hf_state_dict(cls, params: Mapping[str, Tensor]) -> Mapping[str, Ten
     The function is insensitive to prefixes, to allow loading
     both the decoder and the full LM."""
     if issubclass(cls, DecoderModule):
-        stripped_params = {re.sub(r"^model\.", "", k): v for k, v in params.items()}
+        stripped_params = {
+            re.sub(r"^model\.", "", k): v
+            for k, v in params.items()
+            # The decoder does not have output embeddings, avoid unexpected key.
+            if k != "lm_head.weight"
+        }
     else:
         stripped_params = {
             re.sub(r"^model\.", "decoder.", k): v for k, v in params.items()
@@ -52,18 +71,13 @@ def convert_hf_state_dict(cls, params: Mapping[str, Tensor]) -> Mapping[str, Ten
 
     out = {}
     for name, parameter in stripped_params.items():
-        # Attention
+        # Attention, the query, key, and value projections are merged below.
         name = re.sub(r"\.self_attn", r".mha", name)
-        name = re.sub(r"\.q_proj", r".query", name)
-        name = re.sub(r"\.k_proj", r".key", name)
-        name = re.sub(r"\.v_proj", r".value", name)
         name = re.sub(r"\.o_proj", r".output", name)
 
-        # Pointwise feedforward
+        # Pointwise feedforward, the gate and up projections are merged below.
         name = re.sub(r"\.mlp", r".ffn", name)
-        name = re.sub(r"\.up_proj", r".intermediate", name)
         name = re.sub(r"\.down_proj", r".output", name)
-        name = re.sub(r"\.gate_proj", r".gate", name)
 
         # RMS norms
         name = re.sub(r"\.input_layernorm", r".attn_input_layer_norm", name)
@@ -76,4 +90,48 @@ def convert_hf_state_dict(cls, params: Mapping[str, Tensor]) -> Mapping[str, Ten
 
         out[name] = parameter
 
+    for parts, merged_name in MERGED_PARAMETERS:
+        out = _merge_parameters(out, parts=parts, merged_name=merged_name)
+
+    return out
+
+
+def is_incomplete_hf_state_dict_key(key: str) -> bool:
+    """Check if a converted key is a part of a merged parameter that
+    could not be merged yet."""
+    return INCOMPLETE_KEY_PATTERN.search(key) is not None
+
+
+def _merge_parameters(
+    params: Mapping[str, Tensor], *, parts: List[str], merged_name: str
+) -> Dict[str, Tensor]:
+    """
+    Merge parameters that are separate in Hugging Face models, but that
+    are a single parameter in ours. The parts are concatenated along
+    the output dimension in the given order.
+
+    Parts of parameters that are incomplete, e.g. because they are stored
+    in different checkpoint shards, are returned unchanged, so that they
+    can be merged once the remaining parts are loaded.
+    """
+    pattern = re.compile(rf"^(.*)\.({'|'.join(parts)})\.(weight|bias)$")
+
+    out = {}
+    split_params: Dict[Tuple[str, str], Dict[str, Tensor]] = defaultdict(dict)
+    for name, parameter in params.items():
+        match = pattern.match(name)
+        if match is None:
+            out[name] = parameter
+        else:
+            prefix, part, suffix = match.groups()
+            split_params[(prefix, suffix)][part] = parameter
+
+    for (prefix, suffix), split in split_params.items():
+        if len(split) == len(parts):
+            out[f"{prefix}.{merged_name}.{suffix}"] = torch.cat(
+                [split[part] for part in parts], dim=0
+            )
+        else:
+            out.update({f"{prefix}.{part}.{suffix}": v for part, v in split.items()})
+
     return out
@@ -7,7 +7,11 @@ from torch.nn import Linear
 from ...quantization import Quantizable
 from ..hf_hub import FromHFHub
 from ..transformer import TransformerCausalLM
-from ._hf import convert_hf_config, convert_hf_state_dict
+from ._hf import (
+    convert_hf_config,
+    convert_hf_state_dict,
+    is_incomplete_hf_state_dict_key,
+)
 from .config import LlamaConfig
 from .decoder import LlamaDecoder
 
@@ -50,6 +54,10 @@ class LlamaCausalLM(TransformerCausalLM, FromHFHub, Quantizable):
     def convert_hf_state_dict(cls, params: Mapping[str, Tensor]):
         return convert_hf_state_dict(cls, params)
 
+    @classmethod
+    def is_incomplete_hf_state_dict_key(cls, key: str) -> bool:
+        return is_incomplete_hf_state_dict_key(key)
+
     @classmethod
     def from_hf_config(
         cls: Type[Self],
@@ -5,7 +5,12 @@ import torch
 from torch import Tensor
 from torch.nn import Dropout, ModuleList
 
-from ...layers.attention import AttentionHeads, QkvMode, SelfAttention
+from ...layers.attention import (
+    AttentionHeads,
+    QkvMode,
+    QkvSplitGroupedByHead,
+    SelfAttention,
+)
 from ...layers.embeddings import QueryKeyRotaryEmbeddings
 from ...layers.feedforward import PointwiseFeedForward
 from ...layers.normalization import RMSNorm
@@ -19,7 +24,11 @@ from ...layers.transformer import (
 )
 from ..hf_hub import FromHFHub
 from ..transformer import TransformerDecoder
-from ._hf import convert_hf_config, convert_hf_state_dict
+from ._hf import (
+    convert_hf_config,
+    convert_hf_state_dict,
+    is_incomplete_hf_state_dict_key,
+)
 from .config import LlamaConfig
 
 # Only provided as typing.Self in Python 3.11+.
@@ -67,6 +76,7 @@ class LlamaDecoder(TransformerDecoder, FromHFHub):
         attention_heads = AttentionHeads.key_value_broadcast(
             n_query_heads=n_query_heads,
             n_key_value_heads=config.layer.attention.n_key_value_heads,
+            qkv_split=QkvSplitGroupedByHead(),
         )
         layer_norm = partial(
             RMSNorm,
@@ -78,6 +88,15 @@ class LlamaDecoder(TransformerDecoder, FromHFHub):
             raise ValueError(
                 "Llama attention config does not contain rotary embedding parameters"
             )
+        # The rotary embeddings do not have trainable parameters, so we can
+        # share them between layers. This avoids storing the same sine/cosine
+        # tables for every layer.
+        rotary_embeds = QueryKeyRotaryEmbeddings(
+            fraction=config.layer.attention.rotary_embeddings.rotary_fraction,
+            base=config.layer.attention.rotary_embeddings.rotary_base,
+            head_width=hidden_width // n_query_heads,
+            device=device,
+        )
         self.layers = ModuleList(
             [
                 DecoderLayer(
@@ -85,12 +104,8 @@ class LlamaDecoder(TransformerDecoder, FromHFHub):
                         attention_heads=attention_heads,
                         dropout_prob=config.layer.attention.dropout_prob,
                         hidden_width=hidden_width,
-                        qkv_mode=QkvMode.SEPARATE,
-                        rotary_embeds=QueryKeyRotaryEmbeddings(
-                            fraction=config.layer.attention.rotary_embeddings.rotary_fraction,
-                            base=config.layer.attention.rotary_embeddings.rotary_base,
-                            head_width=hidden_width // n_query_heads,
-                        ),
+                        qkv_mode=QkvMode.MERGED_SPLIT_AFTER,
+                        rotary_embeds=rotary_embeds,
                         use_bias=config.layer.attention.use_bias,
                         device=device,
                     ),
@@ -100,6 +115,7 @@ class LlamaDecoder(TransformerDecoder, FromHFHub):
                         intermediate_width=config.layer.feedforward.intermediate_width,
                         use_bias=config.layer.feedforward.use_bias,
                         use_gate=config.layer.feedforward.use_gate,
+                        use_fused_gate=config.layer.feedforward.use_gate,
                         device=device,
                     ),
                     dropouts=TransformerDropouts.layer_output_dropouts(
@@ -123,6 +139,10 @@ class LlamaDecoder(TransformerDecoder, FromHFHub):
     def convert_hf_state_dict(cls, params: Mapping[str, Tensor]):
         return convert_hf_state_dict(cls, params)
 
+    @classmethod
+    def is_incomplete_hf_state_dict_key(cls, key: str) -> bool:
+        return is_incomplete_hf_state_dict_key(key)
+
     @classmethod
     def from_hf_config(
         cls: Type[Self],
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Set
 
 import torch
 from torch import Tensor
@@ -6,11 +6,12 @@ from torch.nn import Module, ModuleList
 
 from ..layers.attention import AttentionMask
 from ..layers.cache import KeyValueCache
+from ..quantization import Quantizable
 from .module import CausalLMModule, DecoderModule, EncoderModule
 from .output import CausalLMOutputWithCache, ModelOutput, ModelOutputWithCache
 
 
-class TransformerDecoder(DecoderModule):
+class TransformerDecoder(DecoderModule, Quantizable):
     """
     Transformer decoder (`Vaswani et al., 2017`_) base class.
 
@@ -39,12 +40,12 @@ class TransformerDecoder(DecoderModule):
         layer_outputs = []
         new_cache = []
         layer_cache = None
-        for layer in self.layers:
+        for layer_idx, layer in enumerate(self.layers):
             if cache is not None:
-                # The key-value cache is stored per layer, so peel off one
-                # layer at a time.
-                layer_cache = cache[0]
-                cache = cache[1:]
+                # The key-value cache is stored per layer. Index the cache
+                # rather than slicing it, slicing copies the remainder of
+                # the list for every layer.
+                layer_cache = cache[layer_idx]
             layer_output, new_layer_cache = layer(
                 layer_output,
                 attention_mask,
@@ -63,6 +64,12 @@ class TransformerDecoder(DecoderModule):
             cache=new_cache if store_cache else None,
         )
 
+    @classmethod
+    def modules_to_not_quantize(cls) -> Set[str]:
+        # Decoders do not have output embeddings, so all linear layers
+        # can be quantized.
+        return set()
+
 
 class TransformerCausalLM(CausalLMModule[KeyValueCache]):
     """
@@ -5,6 +5,8 @@ from curated_transformers.layers.attention import (
     _TORCH_SDP,
     AttentionLinearBiases,
     AttentionMask,
+    ScaledDotProductAttention,
+    create_causal_mask,
     enable_torch_sdp,
 )
 from curated_transformers.models.bert.encoder import BERTEncoder
@@ -273,3 +275,66 @@ def test_attention_linear_biases(torch_device):
             device=torch_device,
         ),
     )
+
+
+@pytest.mark.parametrize("torch_device", TORCH_DEVICES)
+@pytest.mark.parametrize("dtype", [torch.float16, torch.float32])
+def test_attention_mask_logit_mask(torch_device, dtype):
+    mask = AttentionMask(
+        torch.tensor([[True, True, False], [True, False, False]], device=torch_device)
+    )
+    logit_mask = mask.logit_mask(dtype)
+    assert logit_mask.dtype == dtype
+    assert logit_mask.shape == (2, 1, 1, 3)
+    blocked = torch.finfo(dtype).min
+    torch_assertclose(
+        logit_mask,
+        torch.tensor(
+            [[[[0.0, 0.0, blocked]]], [[[0.0, blocked, blocked]]]],
+            dtype=dtype,
+            device=torch_device,
+        ),
+    )
+
+
+@pytest.mark.parametrize("torch_device", TORCH_DEVICES)
+def test_attention_mask_apply_logit_mask_inplace(torch_device):
+    mask = AttentionMask(
+        torch.tensor([[True, True, False], [True, False, False]], device=torch_device)
+    )
+    logits = torch.rand((2, 4, 3, 3), device=torch_device)
+    expected = mask.apply_logit_mask(logits)
+
+    masked = mask.apply_logit_mask(logits, inplace=True)
+    assert masked.data_ptr() == logits.data_ptr()
+    torch_assertclose(masked, expected)
+
+
+@pytest.mark.parametrize("torch_device", TORCH_DEVICES)
+def test_scaled_dot_product_attention(torch_device):
+    mask = AttentionMask(
+        torch.tensor([[True, True, False], [True, False, False]], device=torch_device)
+    )
+    query = torch.rand((2, 4, 3, 8), device=torch_device)
+    key = torch.rand((2, 4, 3, 8), device=torch_device)
+    value = torch.rand((2, 4, 3, 8), device=torch_device)
+    attention = ScaledDotProductAttention(dropout_prob=0.0, linear_biases=None)
+
+    scores = mask.apply_logit_mask(query @ key.transpose(-2, -1) / 8**0.5)
+    torch_assertclose(
+        attention(query=query, key=key, value=value, attention_mask=mask),
+        scores.softmax(dim=-1) @ value,
+    )
+
+
+@pytest.mark.parametrize("torch_device", TORCH_DEVICES)
+@pytest.mark.parametrize("query_len", [1, 3, 5])
+def test_create_causal_mask(torch_device, query_len):
+    key_len = 5
+    query = torch.zeros((2, 4, query_len, 8), device=torch_device)
+    key = torch.zeros((2, 4, key_len, 8), device=torch_device)
+    causal_mask = create_causal_mask(query, key)
+    assert causal_mask.shape == (1, 1, query_len, key_len)
+    expected = torch.ones((key_len, key_len), dtype=torch.bool, device=torch_device)
+    expected = expected.tril()[key_len - query_len :]
+    assert torch.equal(causal_mask.bool_mask.view(query_len, key_len), expected)
@@ -109,6 +109,18 @@ def test_rotary_embeddings_positions_small(device):
     )
 
 
+@pytest.mark.parametrize("device", TORCH_DEVICES)
+def test_rotary_embeddings_offset(device):
+    # Offset exceeds the precomputed length to check resizing.
+    re = RotaryEmbeddings(4, seq_len=8).to(device)
+    X = torch.rand(2, 5, 3, 4, device=device)
+    positions = torch.arange(7, 10, device=device).repeat(2, 1)
+    torch_assertclose(re(X, offset=7), re(X, positions=positions))
+
+    with pytest.raises(ValueError, match=r"both positions and an offset"):
+        re(X, positions=positions, offset=7)
+
+
 def test_sinusoidal_embeddings_without_norm():
     embeddings = SinusoidalPositionalEmbedding(width=6, max_len=512, normalize=False)
     positions = embeddings(torch.ones(4, 20))
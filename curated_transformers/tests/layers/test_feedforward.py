@@ -0,0 +1,44 @@
+import pytest
+import torch
+
+from curated_transformers.layers.feedforward import PointwiseFeedForward
+
+from ..conftest import TORCH_DEVICES
+from ..utils import torch_assertclose
+
+
+def _gated_feedforward(device, use_fused_gate):
+    return PointwiseFeedForward(
+        activation=torch.nn.SiLU(),
+        hidden_width=16,
+        intermediate_width=32,
+        use_bias=True,
+        use_gate=True,
+        use_fused_gate=use_fused_gate,
+        device=device,
+    )
+
+
+@pytest.mark.parametrize("device", TORCH_DEVICES)
+@pytest.mark.parametrize("use_fused_gate", [False, True])
+def test_gated_feedforward_no_grad(device, use_fused_gate):
+    ffn = _gated_feedforward(device, use_fused_gate)
+    X = torch.rand(2, 3, 16, device=device)
+
+    Y = ffn(X)
+    with torch.no_grad():
+        Y_no_grad = ffn(X)
+
+    torch_assertclose(Y_no_grad, Y.detach())
+
+
+@pytest.mark.parametrize("device", TORCH_DEVICES)
+@pytest.mark.parametrize("use_fused_gate", [False, True])
+def test_gated_feedforward_torchscript_trace(device, use_fused_gate):
+    ffn = _gated_feedforward(device, use_fused_gate)
+    X = torch.rand(2, 3, 16, device=device)
+
+    traced = torch.jit.trace(ffn, (X,))
+
+    with torch.no_grad():
+        torch_assertclose(traced(X), ffn(X))
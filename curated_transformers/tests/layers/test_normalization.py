@@ -0,0 +1,25 @@
+import pytest
+import torch
+
+from curated_transformers.layers import normalization
+from curated_transformers.layers.normalization import RMSNorm
+
+from ..conftest import TORCH_DEVICES
+from ..utils import torch_assertclose
+
+
+@pytest.mark.parametrize("device", TORCH_DEVICES)
+@pytest.mark.parametrize("use_rms_norm_function", [False, True])
+def test_rms_norm(device, use_rms_norm_function, monkeypatch):
+    if use_rms_norm_function and not normalization._has_rms_norm:
+        pytest.skip("requires torch.nn.functional.rms_norm")
+    monkeypatch.setattr(normalization, "_has_rms_norm", use_rms_norm_function)
+
+    norm = RMSNorm(16, eps=1e-5, device=device)
+    torch.nn.init.normal_(norm.weight)
+    input = torch.randn(2, 3, 16, device=device)
+
+    expected = (
+        input * torch.rsqrt(input.square().mean(-1, keepdim=True) + 1e-5) * norm.weight
+    )
+    torch_assertclose(norm(input), expected)
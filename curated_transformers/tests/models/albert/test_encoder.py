@@ -1,9 +1,12 @@
 import pytest
+import torch
 
+from curated_transformers.layers.attention import AttentionMask
 from curated_transformers.models.albert import ALBERTConfig, ALBERTEncoder
 
 from ...compat import has_hf_transformers, has_torch_compile
 from ...conftest import TORCH_DEVICES
+from ...utils import torch_assertclose
 from ..util import JITMethod, assert_encoder_output_equals_hf
 
 
@@ -52,3 +55,63 @@ def test_encoder_with_torchscript_trace(torch_device, with_torch_sdp):
         jit_method=JITMethod.TorchScriptTrace,
         with_torch_sdp=with_torch_sdp,
     )
+
+
+@pytest.mark.parametrize("torch_device", TORCH_DEVICES)
+@pytest.mark.parametrize("n_layers_per_group", [1, 2])
+def test_encoder_without_hidden_states(torch_device, n_layers_per_group):
+    config = ALBERTConfig(
+        embedding_width=16,
+        hidden_width=32,
+        intermediate_width=64,
+        n_attention_heads=4,
+        n_hidden_layers=4,
+        n_hidden_groups=2,
+        n_layers_per_group=n_layers_per_group,
+        n_pieces=64,
+    )
+    encoder = ALBERTEncoder(config, device=torch_device)
+    encoder.eval()
+
+    X = torch.randint(0, config.embedding.n_pieces, (2, 10), device=torch_device)
+    mask = AttentionMask(torch.ones_like(X, dtype=torch.bool))
+    with torch.no_grad():
+        Y = encoder(X, mask)
+        Y_last = encoder(X, mask, output_hidden_states=False)
+
+    assert len(Y.all_hidden_layer_states) == config.layer.n_hidden_layers
+    assert len(Y_last.all_hidden_layer_states) == 1
+    torch_assertclose(Y_last.embedding_layer, Y.embedding_layer)
+    torch_assertclose(Y_last.last_hidden_layer_state, Y.last_hidden_layer_state)
+
+
+@pytest.mark.parametrize("torch_device", TORCH_DEVICES)
+def test_encoder_gradient_checkpointing(torch_device):
+    config = ALBERTConfig(
+        embedding_width=16,
+        hidden_width=32,
+        intermediate_width=64,
+        n_attention_heads=4,
+        n_hidden_layers=4,
+        n_hidden_groups=2,
+        n_pieces=64,
+    )
+    encoder = ALBERTEncoder(config, device=torch_device)
+    encoder.train()
+
+    X = torch.randint(0, config.embedding.n_pieces, (2, 10), device=torch_device)
+    mask = AttentionMask(torch.ones_like(X, dtype=torch.bool))
+
+    def output_and_grads():
+        encoder.zero_grad()
+        Y = encoder(X, mask).last_hidden_layer_state
+        Y.sum().backward()
+        return Y.detach(), [param.grad.clone() for param in encoder.parameters()]
+
+    Y, grads = output_and_grads()
+    encoder.enable_gradient_checkpointing()
+    Y_checkpointed, grads_checkpointed = output_and_grads()
+
+    torch_assertclose(Y_checkpointed, Y)
+    for grad_checkpointed, grad in zip(grads_checkpointed, grads):
+        torch_assertclose(grad_checkpointed, grad)
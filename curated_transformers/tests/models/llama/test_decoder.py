@@ -1,9 +1,14 @@
 import pytest
+import torch
 
+from curated_transformers.layers.activations import Activation
+from curated_transformers.models.llama.config import LlamaConfig
 from curated_transformers.models.llama.decoder import LlamaDecoder
+from curated_transformers.util.serde import load_model_from_checkpoints
 
 from ...compat import has_hf_transformers, has_torch_compile
 from ...conftest import TORCH_DEVICES
+from ...utils import torch_assertclose
 from ..util import JITMethod, assert_decoder_output_equals_hf
 
 LLAMA_TEST_MODELS = [
@@ -52,3 +57,120 @@ def test_decoder_with_torchscript_trace(torch_device, model, with_torch_sdp):
         jit_method=JITMethod.TorchScriptTrace,
         with_torch_sdp=with_torch_sdp,
     )
+
+
+def test_convert_hf_state_dict_merges_split_parameters():
+    query = torch.rand((8, 8))
+    key = torch.rand((4, 8))
+    value = torch.rand((4, 8))
+    gate = torch.rand((16, 8))
+    up = torch.rand((16, 8))
+    hf_params = {
+        "model.layers.0.self_attn.q_proj.weight": query,
+        "model.layers.0.self_attn.k_proj.weight": key,
+        "model.layers.0.self_attn.v_proj.weight": value,
+        "model.layers.0.mlp.gate_proj.weight": gate,
+        "model.layers.0.mlp.up_proj.weight": up,
+    }
+
+    converted = LlamaDecoder.convert_hf_state_dict(hf_params)
+    assert set(converted.keys()) == {
+        "layers.0.mha.input.weight",
+        "layers.0.ffn.intermediate.weight",
+    }
+    torch_assertclose(
+        converted["layers.0.mha.input.weight"], torch.cat([query, key, value])
+    )
+    torch_assertclose(
+        converted["layers.0.ffn.intermediate.weight"], torch.cat([gate, up])
+    )
+
+    # Parameters can be split across checkpoint shards. Incomplete parts
+    # must be retained, so they can be merged with the next shard.
+    hf_keys = list(hf_params.keys())
+    partial = LlamaDecoder.convert_hf_state_dict(
+        {k: hf_params[k] for k in hf_keys[::2]}
+    )
+    assert "layers.0.mha.input.weight" not in partial
+    assert "layers.0.ffn.intermediate.weight" not in partial
+    converted_sharded = LlamaDecoder.convert_hf_state_dict(
+        {**partial, **{k: hf_params[k] for k in hf_keys[1::2]}}
+    )
+    assert set(converted_sharded.keys()) == set(converted.keys())
+    for name, param in converted.items():
+        torch_assertclose(converted_sharded[name], param)
+
+
+def test_load_sharded_checkpoints_with_split_parameters(tmp_path):
+    config = LlamaConfig(
+        activation=Activation.SiLU,
+        hidden_width=8,
+        intermediate_width=16,
+        n_query_heads=2,
+        n_key_value_heads=2,
+        n_hidden_layers=1,
+        n_pieces=16,
+        rotary_embedding_fraction=1.0,
+    )
+    reference = LlamaDecoder(config)
+    params = reference.state_dict()
+    query, key, value = params["layers.0.mha.input.weight"].chunk(3, dim=0)
+    gate, up = params["layers.0.ffn.intermediate.weight"].chunk(2, dim=0)
+
+    # Split the merged parameters across the two shards. The rotary
+    # embedding buffer and LM head are unused by the decoder.
+    shards = [
+        {
+            "model.embed_tokens.weight": params["embeddings.piece_embeddings.weight"],
+            "model.layers.0.self_attn.q_proj.weight": query,
+            "model.layers.0.self_attn.rotary_emb.inv_freq": torch.rand(4),
+            "model.layers.0.mlp.gate_proj.weight": gate,
+            "lm_head.weight": torch.rand(16, 8),
+        },
+        {
+            "model.layers.0.self_attn.k_proj.weight": key,
+            "model.layers.0.self_attn.v_proj.weight": value,
+            "model.layers.0.self_attn.o_proj.weight": params[
+                "layers.0.mha.output.weight"
+            ],
+            "model.layers.0.mlp.up_proj.weight": up,
+            "model.layers.0.mlp.down_proj.weight": params["layers.0.ffn.output.weight"],
+            "model.layers.0.input_layernorm.weight": params[
+                "layers.0.attn_input_layer_norm.weight"
+            ],
+            "model.layers.0.post_attention_layernorm.weight": params[
+                "layers.0.ffn_input_layer_norm.weight"
+            ],
+            "model.norm.weight": params["output_layer_norm.weight"],
+        },
+    ]
+    filepaths = []
+    for idx, shard in enumerate(shards):
+        filepath = str(tmp_path / f"pytorch_model-{idx}.bin")
+        torch.save(shard, filepath)
+        filepaths.append(filepath)
+
+    converter_inputs = []
+
+    def state_dict_converter(params):
+        converter_inputs.append(set(params.keys()))
+        return LlamaDecoder.convert_hf_state_dict(params)
+
+    decoder = LlamaDecoder(config, device=torch.device("meta"))
+    load_model_from_checkpoints(
+        decoder,
+        filepaths=filepaths,
+        state_dict_converter=state_dict_converter,
+        is_incomplete_key=LlamaDecoder.is_incomplete_hf_state_dict_key,
+    )
+
+    # Only the incomplete parts are passed to the converter again.
+    assert converter_inputs[1] == set(shards[1].keys()) | {
+        "layers.0.mha.q_proj.weight",
+        "layers.0.ffn.gate_proj.weight",
+    }
+
+    loaded_params = decoder.state_dict()
+    assert loaded_params.keys() == params.keys()
+    for name, param in params.items():
+        torch_assertclose(loaded_params[name], param)
@@ -0,0 +1,62 @@
+import pytest
+import torch
+
+from curated_transformers._compat import has_bitsandbytes
+from curated_transformers.models import (
+    FalconConfig,
+    FalconDecoder,
+    GPTNeoXConfig,
+    GPTNeoXDecoder,
+    LlamaConfig,
+    LlamaDecoder,
+    MPTConfig,
+    MPTDecoder,
+)
+from curated_transformers.quantization import prepare_module_for_quantization
+from curated_transformers.quantization.bnb import BitsAndBytesConfig
+
+
+@pytest.mark.skipif(not has_bitsandbytes, reason="requires bitsandbytes")
+@pytest.mark.parametrize(
+    "decoder_cls,config",
+    [
+        (
+            FalconDecoder,
+            FalconConfig(hidden_width=32, n_query_heads=4, n_hidden_layers=2),
+        ),
+        (
+            GPTNeoXDecoder,
+            GPTNeoXConfig(
+                hidden_width=32,
+                intermediate_width=64,
+                n_attention_heads=4,
+                n_hidden_layers=2,
+            ),
+        ),
+        (
+            LlamaDecoder,
+            LlamaConfig(
+                hidden_width=32,
+                intermediate_width=64,
+                n_query_heads=4,
+                n_key_value_heads=4,
+                n_hidden_layers=2,
+            ),
+        ),
+        (
+            MPTDecoder,
+            MPTConfig(hidden_width=32, n_attention_heads=4, n_hidden_layers=2),
+        ),
+    ],
+)
+def test_decoder_quantizable(decoder_cls, config):
+    import bitsandbytes as bnb
+
+    decoder = decoder_cls(config, device=torch.device("meta"))
+    prepare_module_for_quantization(decoder, BitsAndBytesConfig.for_8bit())
+
+    linears = [
+        module for module in decoder.modules() if isinstance(module, torch.nn.Linear)
+    ]
+    assert len(linears) != 0
+    assert all(isinstance(module, bnb.nn.Linear8bitLt) for module in linears)
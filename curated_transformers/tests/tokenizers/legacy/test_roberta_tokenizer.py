@@ -1,7 +1,9 @@
 import pytest
 import torch
+from curated_tokenizers import ByteBPEProcessor
 
 from curated_transformers.tokenizers import PiecesWithIds
+from curated_transformers.tokenizers.chunks import InputChunks, SpecialPieceChunk
 from curated_transformers.tokenizers.legacy import RoBERTaTokenizer
 
 from ...compat import has_hf_transformers
@@ -28,6 +30,30 @@ def test_from_files(toy_tokenizer_from_files, short_sample_texts):
     _check_toy_tokenizer(encoding)
 
 
+def test_special_piece_ids(test_dir):
+    processor = ByteBPEProcessor.load_from_files(
+        vocab=test_dir / "toy-vocab.json", merges=test_dir / "toy-merges.txt"
+    )
+    vocab = processor.vocab
+    mask_id = len(vocab)
+    tokenizer = RoBERTaTokenizer(
+        vocab=vocab, merges=processor.merges, special_pieces={"<mask>": mask_id}
+    )
+
+    # Special pieces and the BOS/EOS pieces are resolved through the cache.
+    assert tokenizer._special_piece_ids == {"<mask>": mask_id, "<s>": 0, "</s>": 2}
+
+    # Other pieces fall back to the processor.
+    pieces = tokenizer(
+        [InputChunks([SpecialPieceChunk("<mask>"), SpecialPieceChunk("<pad>")])]
+    )
+    assert pieces.ids == [[0, mask_id, 1, 2]]
+    assert pieces.pieces == [["<s>", "<mask>", "<pad>", "</s>"]]
+
+    with pytest.raises(ValueError, match=r"Unknown special piece: <foo>"):
+        tokenizer([InputChunks([SpecialPieceChunk("<foo>")])])
+
+
 def _check_toy_tokenizer(pieces):
     assert isinstance(pieces, PiecesWithIds)
     assert len(pieces.ids) == 3
@@ -3,8 +3,9 @@ from pathlib import Path
 from typing import Optional
 
 import pytest
+import torch
 
-from curated_transformers.tokenizers import Tokenizer
+from curated_transformers.tokenizers import PiecesWithIds, Tokenizer
 from curated_transformers.tokenizers.chunks import InputChunks, TextChunk
 from curated_transformers.util.hf import TOKENIZER_JSON
 
@@ -113,3 +114,27 @@ def test_invalid_string_input(toy_tokenizer):
 def test_invalid_chunk_input(toy_tokenizer):
     with pytest.raises(ValueError, match=r"Non-chunk.*float, int"):
         toy_tokenizer([InputChunks([TextChunk("hello")]), 42, 3.14159])
+
+
+def test_pieces_with_ids_padding():
+    pieces = PiecesWithIds(
+        ids=[[1, 2, 3], [4], [5, 6]],
+        pieces=[["a", "b", "c"], ["d"], ["e", "f"]],
+    )
+
+    torch_assertclose(
+        pieces.padded_tensor(padding_id=-1),
+        torch.tensor([[1, 2, 3], [4, -1, -1], [5, 6, -1]], dtype=torch.int32),
+    )
+    torch_assertclose(
+        pieces.padded_tensor(padding_id=-1, pad_left=True),
+        torch.tensor([[1, 2, 3], [-1, -1, 4], [-1, 5, 6]], dtype=torch.int32),
+    )
+    torch_assertclose(
+        pieces.attention_mask().bool_mask.squeeze(dim=(1, 2)),
+        torch.tensor([[True, True, True], [True, False, False], [True, True, False]]),
+    )
+    torch_assertclose(
+        pieces.attention_mask(pad_left=True).bool_mask.squeeze(dim=(1, 2)),
+        torch.tensor([[True, True, True], [False, False, True], [False, True, True]]),
+    )
@@ -41,6 +41,11 @@ class ByteBPETokenizer(LegacyTokenizer):
         vocab.update(self.special_piece_to_id)
         self.processor = ByteBPEProcessor(vocab, merges)
 
+        # Special pieces are added to every sequence. Cache their identifiers,
+        # so that we do not have to look them up in the processor for every
+        # sequence. Subclasses can add the pieces that they insert.
+        self._special_piece_ids = dict(self.special_piece_to_id)
+
     def piece_to_id(self, piece: str) -> Optional[int]:
         return self.processor.token_to_id(piece)
 
@@ -67,7 +72,9 @@ class ByteBPETokenizer(LegacyTokenizer):
 
             for chunk in seq:
                 if isinstance(chunk, MergedSpecialPieceChunk):
-                    piece_id = self.processor.piece_to_id(chunk.piece)
+                    piece_id = self._special_piece_ids.get(chunk.piece)
+                    if piece_id is None:
+                        piece_id = self.processor.piece_to_id(chunk.piece)
                     if piece_id is None:
                         raise ValueError(f"Unknown special piece: {chunk.piece}")
                     seq_ids.append(piece_id)
@@ -73,6 +73,7 @@ class RoBERTaTokenizer(ByteBPETokenizer, LegacyFromHFHub):
 
         bos_id = _get_piece_id_or_fail(self.processor, bos_piece)
         eos_id = _get_piece_id_or_fail(self.processor, eos_piece)
+        self._special_piece_ids.update({bos_piece: bos_id, eos_piece: eos_id})
 
         self._eos_piece = eos_piece
 
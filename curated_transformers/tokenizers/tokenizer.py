@@ -1,6 +1,7 @@
 import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Type, TypeVar, Union, cast
 
@@ -58,15 +59,7 @@ class PiecesWithIds:
 
             *Shape:* ``(batch_size, max_seq_len)``
         """
-        n_seqs = len(self.ids)
-        max_len = max(len(seq_ids) for seq_ids in self.ids)
-        mask = torch.full((n_seqs, max_len), False, device=device)
-        for idx, seq_ids in enumerate(self.ids):
-            if pad_left:
-                mask[idx, -len(seq_ids) :] = True
-            else:
-                mask[idx, : len(seq_ids)] = True
-        return AttentionMask(mask)
+        return AttentionMask(self._non_padding_mask(pad_left=pad_left, device=device))
 
     def padded_tensor(
         self,
@@ -92,18 +85,39 @@ class PiecesWithIds:
 
             *Shape:* ``(batch_size, max_seq_len)``
         """
-        n_seqs = len(self.ids)
-        max_len = max(len(seq_ids) for seq_ids in self.ids)
-        padded = torch.full(
-            (n_seqs, max_len), padding_id, dtype=torch.int32, device=device
+        mask = self._non_padding_mask(pad_left=pad_left, device=device)
+        padded = torch.full(mask.shape, padding_id, dtype=torch.int32, device=device)
+        # Boolean mask assignment fills the unmasked positions in row-major
+        # order, so we can copy all identifiers at once.
+        padded[mask] = torch.tensor(
+            list(chain.from_iterable(self.ids)), dtype=torch.int32, device=device
         )
-        for idx, seq_ids in enumerate(self.ids):
-            if pad_left:
-                padded[idx, -len(seq_ids) :] = torch.tensor(seq_ids)
-            else:
-                padded[idx, : len(seq_ids)] = torch.tensor(seq_ids)
         return padded
 
+    def _non_padding_mask(
+        self, *, pad_left: bool, device: Optional[torch.device]
+    ) -> Tensor:
+        """
+        Generate a mask that is ``True`` for non-padding positions.
+
+        :param pad_left:
+            Use left-padding when set to ``True``.
+        :param device:
+            Device on which the mask is created.
+        :returns:
+            The non-padding mask.
+
+            *Shape:* ``(batch_size, max_seq_len)``
+        """
+        seq_lens = [len(seq_ids) for seq_ids in self.ids]
+        max_len = max(seq_lens)
+        lens = torch.tensor(seq_lens, device=device).unsqueeze(-1)
+        positions = torch.arange(max_len, device=device)
+        if pad_left:
+            return positions >= max_len - lens
+        else:
+            return positions < lens
+
 
 class TokenizerBase(ABC):
     """
@@ -25,6 +25,7 @@ def load_model_from_checkpoints(
     state_dict_converter: HFStateDictConverterT,
     tensor_to_param_converter: Optional[TensorToParameterConverterT] = None,
     device: Optional[torch.device] = None,
+    is_incomplete_key: Optional[Callable[[str], bool]] = None,
 ):
     """
     Load parameters from PyTorch checkpoints with minimal copies.
@@ -41,6 +42,13 @@ def load_model_from_checkpoints(
         Useful for loading quantized weights.
     :param device:
         Device in which to place the loaded parameters.
+    :param is_incomplete_key:
+        Callback that returns ``True`` for converted keys of tensors that
+        are parts of a parameter that could not be completed yet (e.g.
+        because its parts are stored in different checkpoints). These
+        tensors are passed to the state dict converter again, together
+        with the next checkpoint. All other converted tensors that are
+        not parameters or buffers of the model are discarded.
     """
     state_dicts = _load_state_dicts_from_checkpoints(filepaths)
     # We need to cache the model's parameter keys before loading the state
@@ -49,8 +57,19 @@ def load_model_from_checkpoints(
     module_keys = set(model.state_dict().keys())
     seen_keys: Set[str] = set()
 
+    # Parts of parameters that are split across checkpoints. They are passed
+    # to the converter again with the next checkpoint, so that they can be
+    # merged once all parts are loaded.
+    pending: Dict[str, torch.Tensor] = {}
+
     for state_dict in state_dicts:
-        converted = state_dict_converter(state_dict)
+        converted = state_dict_converter({**pending, **state_dict})
+        if is_incomplete_key is not None:
+            pending = {
+                k: v
+                for k, v in converted.items()
+                if k not in module_keys and is_incomplete_key(k)
+            }
         if len(converted) == 0:
             continue
         seen_keys.update(converted.keys())
@@ -96,6 +115,10 @@ def default_tensor_to_parameter_converter(
     old_param = module._parameters[parameter_name]
     assert old_param is not None
     _validate_replacement(old_param, tensor, module_prefix)
+    # Checkpoints can store tensors with any strides (e.g. views of larger
+    # tensors). Store parameters contiguously, so that kernels do not have to
+    # copy them on every use. This is a no-op for contiguous tensors.
+    tensor = tensor.contiguous()
     return Parameter(tensor, requires_grad=old_param.requires_grad).to(device=device)  # type: ignore
 
 